@@ -8,7 +8,8 @@ setup(
     entry_points={
         "console_scripts": [
             "gwtm=gwtm.main:main",
+            "gwtm-daemon=gwtm.main:daemon_main",
         ],
     },
-    python_requires=">=3.7",
+    python_requires=">=3.9",
 )
\ No newline at end of file
@@ -1,36 +1,167 @@
 """IDE integration utilities for Git WorkTree Manager."""
 
+import functools
+import json
 import os
 import platform
 import subprocess
+import time
+from collections import deque
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple, FrozenSet
+
+# Directories that never contain the project files we look for but can hold
+# tens of thousands of entries (dependency trees, build output).
+_PRUNE_DIRS = frozenset({".git", "node_modules", "Pods", "build", ".gradle", "DerivedData"})
+
+# On-disk index of previously discovered projects, so re-opening a worktree
+# costs a couple of stat() calls instead of a full rescan.
+_CACHE_PATH = os.path.join(os.path.expanduser("~/.cache/gwtm"), "ide_index.json")
+
+# The platform never changes within a process; resolve it once and pick the
+# matching launch strategy at import time.
+_PLATFORM = platform.system()
+
+
+def _open_via_open_dash_a(ide_path: str, project_path: str) -> bool:
+    """Launch via `open -a` (macOS)."""
+    result = subprocess.run(["open", "-a", ide_path, str(project_path)],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"Error running: open -a '{ide_path}' '{project_path}'")
+        print(f"Error output: {result.stderr}")
+        return False
+    return True
+
+
+def _open_via_exec(ide_path: str, project_path: str) -> bool:
+    """Launch the IDE executable directly (Linux)."""
+    subprocess.run([ide_path, str(project_path)])
+    return True
+
+
+def _open_via_exec_shell(ide_path: str, project_path: str) -> bool:
+    """Launch through the shell (Windows)."""
+    subprocess.run([ide_path, str(project_path)], shell=True)
+    return True
+
+
+_OPENER = {
+    "Darwin": _open_via_open_dash_a,
+    "Linux": _open_via_exec,
+    "Windows": _open_via_exec_shell,
+}.get(_PLATFORM)
+
+
+def _find_first(root: str, suffixes: Tuple[str, ...],
+                prune: FrozenSet[str] = _PRUNE_DIRS) -> Optional[Path]:
+    """Breadth-first search for the first entry whose name ends with one of
+    the given suffixes, pruning known-uninteresting directories.
+
+    Uses os.scandir so directory-vs-file type checks come from the readdir
+    data instead of extra stat() calls, and stops at the first match rather
+    than walking the whole tree.
+    """
+    queue = deque([root])
+    while queue:
+        current = queue.popleft()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(suffixes):
+                    return Path(entry.path)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir and entry.name not in prune:
+                    queue.append(entry.path)
+    return None
 
 
 class IDEHandler:
     """Handles opening worktrees in different IDEs."""
-    
-    def __init__(self, ide_paths: dict):
-        self.ide_paths = ide_paths
-    
+
+    def __init__(self, ide_paths: dict, use_cache: bool = True):
+        # Normalize key casing once so lookups are plain dict gets
+        self.ide_paths = {k.lower(): v for k, v in ide_paths.items()}
+        self.use_cache = use_cache
+        self._cache = None  # loaded lazily on first lookup
+        self._handlers = {
+            "xcode": self._open_in_xcode,
+            "androidstudio": self._open_in_android_studio,
+        }
+
+    def _load_cache(self) -> dict:
+        """Load the on-disk discovery index, tolerating a missing or corrupt file."""
+        if self._cache is None:
+            try:
+                with open(_CACHE_PATH) as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _cache_get(self, abs_path: str, ide: str) -> Optional[str]:
+        """Return the cached project path for (worktree, ide) if still valid."""
+        if not self.use_cache:
+            return None
+        entry = self._load_cache().get(f"{abs_path}|{ide}")
+        if not entry:
+            return None
+        try:
+            mtime = os.stat(abs_path).st_mtime
+        except OSError:
+            return None
+        # Directory mtime changes whenever top-level entries change
+        if entry.get("mtime") != mtime:
+            return None
+        project_path = entry.get("project_path")
+        if project_path and os.path.exists(project_path):
+            return project_path
+        return None
+
+    def _cache_put(self, abs_path: str, ide: str, project_path) -> None:
+        """Record a discovered project path, written atomically via os.replace."""
+        if not self.use_cache:
+            return
+        cache = self._load_cache()
+        try:
+            mtime = os.stat(abs_path).st_mtime
+        except OSError:
+            return
+        cache[f"{abs_path}|{ide}"] = {
+            "project_path": str(project_path),
+            "mtime": mtime,
+            "verified_at": time.time(),
+        }
+        try:
+            os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+            tmp_path = _CACHE_PATH + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, _CACHE_PATH)
+        except OSError:
+            pass
+
     def get_ide_path(self, ide: str) -> Optional[str]:
-        """Get the path to the IDE executable."""
-        return self.ide_paths.get(ide.lower())
-    
+        """Get the path to the IDE executable (ide must be lowercase)."""
+        return self.ide_paths.get(ide)
+
     def open_in_ide(self, worktree_path: str, ide: str) -> bool:
         """Open a worktree in the specified IDE."""
+        ide = ide.lower()
         ide_path = self.get_ide_path(ide)
         if not ide_path or not os.path.exists(ide_path):
             return False
-            
+
         abs_path = os.path.abspath(worktree_path)
-        
-        if ide.lower() == "xcode":
-            return self._open_in_xcode(abs_path, ide_path)
-        elif ide.lower() == "androidstudio":
-            return self._open_in_android_studio(abs_path, ide_path)
-        else:
-            return False
+
+        handler = self._handlers.get(ide)
+        return handler(abs_path, ide_path) if handler else False
     
     def _open_in_xcode(self, path: str, ide_path: str) -> bool:
         """Open a worktree in Xcode."""
@@ -54,36 +185,39 @@ class IDEHandler:
             # If no ios directory, use the original path
             search_path = path
             
-        # Look for .xcodeproj or .xcworkspace files
-        xcodeproj = list(Path(search_path).glob("**/*.xcodeproj"))
-        xcworkspace = list(Path(search_path).glob("**/*.xcworkspace"))
-        
-        if xcworkspace:
-            project_path = xcworkspace[0]
-            print(f"Found Xcode workspace: {project_path}")
-        elif xcodeproj:
-            project_path = xcodeproj[0]
-            print(f"Found Xcode project: {project_path}")
+        cached = self._cache_get(path, "xcode")
+        if cached:
+            project_path = Path(cached)
+            print(f"Found Xcode project (cached): {project_path}")
         else:
-            print(f"Error: No Xcode project or workspace found in {search_path}")
-            return False
-            
-        if platform.system() == "Darwin":  # macOS
-            try:
-                print(f"Opening Xcode with project: {project_path}")
-                result = subprocess.run(["open", "-a", ide_path, str(project_path)], capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"Error running: open -a '{ide_path}' '{project_path}'")
-                    print(f"Error output: {result.stderr}")
-                    return False
-                print(f"Successfully opened Xcode with project: {project_path}")
-                return True
-            except Exception as e:
-                print(f"Exception while opening Xcode: {e}")
+            # Look for .xcodeproj or .xcworkspace files (workspace preferred)
+            xcworkspace = _find_first(search_path, (".xcworkspace",))
+            xcodeproj = None if xcworkspace else _find_first(search_path, (".xcodeproj",))
+
+            if xcworkspace:
+                project_path = xcworkspace
+                print(f"Found Xcode workspace: {project_path}")
+            elif xcodeproj:
+                project_path = xcodeproj
+                print(f"Found Xcode project: {project_path}")
+            else:
+                print(f"Error: No Xcode project or workspace found in {search_path}")
                 return False
-        else:
+            self._cache_put(path, "xcode", project_path)
+            
+        if _PLATFORM != "Darwin":  # macOS only
             print(f"Xcode is only supported on macOS")
             return False
+
+        try:
+            print(f"Opening Xcode with project: {project_path}")
+            if not _open_via_open_dash_a(ide_path, project_path):
+                return False
+            print(f"Successfully opened Xcode with project: {project_path}")
+            return True
+        except Exception as e:
+            print(f"Exception while opening Xcode: {e}")
+            return False
     
     def _open_in_android_studio(self, path: str, ide_path: str) -> bool:
         """Open a worktree in Android Studio."""
@@ -102,63 +236,49 @@ class IDEHandler:
             print(f"androidstudio = /path/to/Android Studio.app")
             return False
         
-        # First, check if there's a specific 'android' directory
-        android_dir = os.path.join(path, "android")
-        if os.path.isdir(android_dir):
-            print(f"Found Android directory at: {android_dir}")
-            project_path = android_dir
+        cached = self._cache_get(path, "androidstudio")
+        if cached:
+            print(f"Found Android project (cached): {cached}")
+            project_path = cached
         else:
-            # If no android directory, use the original path
-            project_path = path
-            
-        # Look for Android project indicators in the selected path
-        gradle_files = list(Path(project_path).glob("**/build.gradle"))
-        android_manifests = list(Path(project_path).glob("**/AndroidManifest.xml"))
-        java_files = list(Path(project_path).glob("**/*.java"))
-        kotlin_files = list(Path(project_path).glob("**/*.kt"))
-        
-        # Project indicators found?
-        if not (gradle_files or android_manifests or java_files or kotlin_files):
-            print(f"Warning: No Android project files found in {project_path}")
-            print(f"Continuing anyway - Android Studio will open the directory.")
-            # Continue anyway - user might know what they're doing
+            # First, check if there's a specific 'android' directory
+            android_dir = os.path.join(path, "android")
+            if os.path.isdir(android_dir):
+                print(f"Found Android directory at: {android_dir}")
+                project_path = android_dir
+            else:
+                # If no android directory, use the original path
+                project_path = path
+
+            # Look for Android project indicators in the selected path; a single
+            # pass short-circuits as soon as any indicator is seen
+            indicator = _find_first(project_path,
+                                    ("build.gradle", "AndroidManifest.xml", ".java", ".kt"))
+
+            # Project indicators found?
+            if indicator:
+                self._cache_put(path, "androidstudio", project_path)
+            else:
+                print(f"Warning: No Android project files found in {project_path}")
+                print(f"Continuing anyway - Android Studio will open the directory.")
+                # Continue anyway - user might know what they're doing
             
-        if platform.system() == "Darwin":  # macOS
-            try:
-                print(f"Opening Android Studio with path: {project_path}")
-                result = subprocess.run(["open", "-a", ide_path, project_path], capture_output=True, text=True)
-                if result.returncode != 0:
-                    print(f"Error running: open -a '{ide_path}' '{project_path}'")
-                    print(f"Error output: {result.stderr}")
-                    return False
-                print(f"Successfully opened Android Studio with project: {project_path}")
-                return True
-            except Exception as e:
-                print(f"Exception while opening Android Studio: {e}")
-                return False
-        elif platform.system() == "Linux":
-            try:
-                print(f"Opening Android Studio with path: {project_path}")
-                subprocess.run([ide_path, project_path])
-                print(f"Successfully opened Android Studio with project: {project_path}")
-                return True
-            except Exception as e:
-                print(f"Exception while opening Android Studio: {e}")
-                return False
-        elif platform.system() == "Windows":
-            try:
-                print(f"Opening Android Studio with path: {project_path}")
-                subprocess.run([ide_path, project_path], shell=True)
-                print(f"Successfully opened Android Studio with project: {project_path}")
-                return True
-            except Exception as e:
-                print(f"Exception while opening Android Studio: {e}")
+        if _OPENER is None:
+            print(f"Unsupported operating system: {_PLATFORM}")
+            return False
+
+        try:
+            print(f"Opening Android Studio with path: {project_path}")
+            if not _OPENER(ide_path, project_path):
                 return False
-        else:
-            print(f"Unsupported operating system: {platform.system()}")
+            print(f"Successfully opened Android Studio with project: {project_path}")
+            return True
+        except Exception as e:
+            print(f"Exception while opening Android Studio: {e}")
             return False
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_supported_ides() -> List[str]:
         """Get a list of supported IDEs."""
         return ["xcode", "androidstudio"]
\ No newline at end of file
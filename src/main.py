@@ -2,10 +2,20 @@
 
 import argparse
 import configparser
+import contextlib
+import functools
+import io
+import json
 import os
+import pickle
+import selectors
+import shlex
+import socket
 import subprocess
 import sys
+import tempfile
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
@@ -20,23 +30,81 @@ except ImportError:
         from gwtm.ide import IDEHandler
 
 
+# Snapshot of the parsed config, so repeated invocations skip the
+# configparser tokenization work when the .gwtmrc is unchanged
+_CONFIG_CACHE_PATH = os.path.join(os.path.expanduser("~/.cache/gwtm"), "config.pkl")
+
+
+class _ConfigSnapshot:
+    """Read-only stand-in for ConfigParser backed by a plain dict-of-dicts.
+
+    Implements only the access patterns the manager uses:
+    config.get(section, key, fallback=...) and config[section].
+    """
+
+    def __init__(self, sections: Dict[str, Dict[str, str]]):
+        self._sections = sections
+
+    def __getitem__(self, section: str) -> Dict[str, str]:
+        return self._sections[section]
+
+    def get(self, section: str, key: str, fallback: Any = None) -> Any:
+        return self._sections.get(section, {}).get(key, fallback)
+
+
+@dataclass
+class GitContext:
+    """Answers to the repo-level questions most commands ask up front."""
+    inside: bool
+    toplevel: Optional[str] = None
+    head_branch: Optional[str] = None
+
+
 class GitWorktreeManager:
     def __init__(self, config_path: Optional[str] = None, debug: bool = False):
         self.config = self._load_config(config_path)
-        
-        # Setup logging
-        log_level = logging.DEBUG if debug else logging.INFO
-        logging.basicConfig(level=log_level, format='%(levelname)s: %(message)s')
+        self._git_ctx: Optional[GitContext] = None
+
+        # Setup logging; only configure handlers when debug output is wanted
+        if debug:
+            logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
         self.logger = logging.getLogger('gwtm')
-        
-        # Initialize IDE handler
-        ide_paths = dict(self.config["paths"])
-        self.ide_handler = IDEHandler(ide_paths)
+
+    @functools.cached_property
+    def ide_handler(self) -> IDEHandler:
+        """IDE handler, constructed on first use (only the open command needs it)"""
+        return IDEHandler(dict(self.config["paths"]))
     
-    def _load_config(self, config_path: Optional[str] = None) -> configparser.ConfigParser:
+    def _load_config(self, config_path: Optional[str] = None) -> Any:
         """Load configuration from .gwtmrc file"""
+        # Look for config file in these locations (in order of precedence)
+        locations = [
+            config_path,
+            os.path.join(os.getcwd(), ".gwtmrc"),
+            os.path.expanduser("~/.gwtmrc")
+        ]
+
+        location = None
+        mtime_ns = None
+        for candidate in locations:
+            if candidate and os.path.exists(candidate):
+                location = candidate
+                mtime_ns = os.stat(candidate).st_mtime_ns
+                break
+
+        # Serve the parsed result from the snapshot cache if the same file
+        # is unchanged since it was written
+        if location is not None:
+            try:
+                with open(_CONFIG_CACHE_PATH, "rb") as f:
+                    cached_path, cached_mtime_ns, sections = pickle.load(f)
+                if cached_path == location and cached_mtime_ns == mtime_ns:
+                    return _ConfigSnapshot(sections)
+            except (OSError, pickle.PickleError, ValueError, EOFError):
+                pass
+
         config = configparser.ConfigParser()
-        
+
         # Default configuration
         config["defaults"] = {
             "ide": "xcode",
@@ -46,40 +114,144 @@ class GitWorktreeManager:
             "xcode": "/Applications/Xcode.app",
             "androidstudio": "/Applications/Android Studio.app"
         }
-        
-        # Look for config file in these locations (in order of precedence)
-        locations = [
-            config_path,
-            os.path.join(os.getcwd(), ".gwtmrc"),
-            os.path.expanduser("~/.gwtmrc")
-        ]
-        
-        for location in locations:
-            if location and os.path.exists(location):
-                config.read(location)
-                break
-                
+
+        if location is not None:
+            config.read(location)
+
+            # Write-through a plain dict snapshot for the next invocation
+            sections = {section: dict(config[section]) for section in config.sections()}
+            try:
+                os.makedirs(os.path.dirname(_CONFIG_CACHE_PATH), exist_ok=True)
+                tmp_path = _CONFIG_CACHE_PATH + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    pickle.dump((location, mtime_ns, sections), f)
+                os.replace(tmp_path, _CONFIG_CACHE_PATH)
+            except OSError:
+                pass
+
         return config
     
-    def _run_git(self, args: List[str], capture_output: bool = True) -> subprocess.CompletedProcess:
-        """Run a git command"""
+    @staticmethod
+    def _drain_fds(out_fd: int, err_fd: int) -> tuple:
+        """Read both pipes to EOF concurrently and close them.
+
+        Draining them one after the other would deadlock once the child
+        fills a pipe buffer on the not-yet-read side (git merge and hooks
+        can emit arbitrary amounts of stderr), so multiplex with select.
+        """
+        chunks = {out_fd: [], err_fd: []}
+        sel = selectors.DefaultSelector()
+        for fd in (out_fd, err_fd):
+            os.set_blocking(fd, False)
+            sel.register(fd, selectors.EVENT_READ)
+        while sel.get_map():
+            for key, _ in sel.select():
+                chunk = os.read(key.fd, 65536)
+                if chunk:
+                    chunks[key.fd].append(chunk)
+                else:
+                    sel.unregister(key.fd)
+                    os.close(key.fd)
+        sel.close()
+        return b"".join(chunks[out_fd]), b"".join(chunks[err_fd])
+
+    def _spawn_git_capture(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """Run git with captured output via os.posix_spawnp.
+
+        posix_spawn avoids the fork() page-table copy that subprocess.run
+        pays on every invocation, which adds up across the several git
+        calls a single command makes.
+        """
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        try:
+            file_actions = [
+                (os.POSIX_SPAWN_DUP2, out_w, 1),
+                (os.POSIX_SPAWN_DUP2, err_w, 2),
+            ]
+            pid = os.posix_spawnp(cmd[0], cmd, os.environ, file_actions=file_actions)
+        except OSError:
+            for fd in (out_r, out_w, err_r, err_w):
+                os.close(fd)
+            raise
+        os.close(out_w)
+        os.close(err_w)
+        stdout, stderr = self._drain_fds(out_r, err_r)
+        _, status = os.waitpid(pid, 0)
+        returncode = os.waitstatus_to_exitcode(status)
+        return subprocess.CompletedProcess(cmd, returncode,
+                                           stdout.decode(errors="replace"),
+                                           stderr.decode(errors="replace"))
+
+    def _git_capture(self, args: List[str]) -> subprocess.CompletedProcess:
+        """Run a git command whose output the caller inspects"""
         cmd = ["git"] + args
-        return subprocess.run(cmd, capture_output=capture_output, text=True)
+        if hasattr(os, "posix_spawnp"):
+            return self._spawn_git_capture(cmd)
+        return subprocess.run(cmd, capture_output=True, text=True)
+
+    def _git_passthrough(self, args: List[str]) -> subprocess.CompletedProcess:
+        """Run a git command with inherited stdio.
+
+        For commands whose output is meant for the user (checkout, fetch,
+        worktree add/remove) this skips the pipe setup and decode pass and
+        shows git's own progress live.
+        """
+        return subprocess.run(["git"] + args)
     
+    def _git_bulk_status(self) -> Dict[str, Optional[str]]:
+        """Map each worktree's absolute path to its checked-out branch name.
+
+        One `git worktree list --porcelain` call answers every per-worktree
+        question (existence, branch) that would otherwise take a git spawn
+        apiece.
+        """
+        result = self._git_capture(["worktree", "list", "--porcelain"])
+        worktrees: Dict[str, Optional[str]] = {}
+        current_worktree = None
+        for line in result.stdout.splitlines():
+            if line.startswith("worktree "):
+                current_worktree = line[len("worktree "):]
+                worktrees[current_worktree] = None
+            elif line.startswith("branch ") and current_worktree:
+                branch = line[len("branch "):]
+                # Convert from refs/heads/branch-name to just branch-name
+                if branch.startswith("refs/heads/"):
+                    branch = branch[len("refs/heads/"):]
+                worktrees[current_worktree] = branch
+        return worktrees
+
+    def _git_context(self) -> GitContext:
+        """Get repo membership, toplevel and HEAD branch with one git spawn.
+
+        rev-parse answers multiple queries in a single invocation, one line
+        each; the result is cached on the instance since it cannot change
+        within one command.
+        """
+        if self._git_ctx is None:
+            result = self._git_capture(["rev-parse", "--is-inside-work-tree",
+                                    "--show-toplevel", "--abbrev-ref", "HEAD"])
+            # rev-parse answers what it can even when a later query fails
+            # (e.g. --abbrev-ref HEAD on an unborn branch), so go by the
+            # emitted lines rather than the return code
+            lines = result.stdout.splitlines()
+            if not lines or lines[0] != "true":
+                self._git_ctx = GitContext(inside=False)
+            else:
+                self._git_ctx = GitContext(
+                    inside=True,
+                    toplevel=lines[1] if len(lines) > 1 else None,
+                    head_branch=lines[2] if len(lines) > 2 else None,
+                )
+        return self._git_ctx
+
     def _is_git_repo(self) -> bool:
         """Check if current directory is a git repository"""
-        result = self._run_git(["rev-parse", "--is-inside-work-tree"])
-        return result.returncode == 0
-        
+        return self._git_context().inside
+
     def _get_repo_root(self) -> Optional[str]:
         """Get the root directory of the git repository"""
-        if not self._is_git_repo():
-            return None
-        
-        result = self._run_git(["rev-parse", "--show-toplevel"])
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
+        return self._git_context().toplevel
         
     def _ensure_worktree_location(self) -> str:
         """Ensure the default worktree location exists and is git-ignored"""
@@ -104,21 +276,23 @@ class GitWorktreeManager:
         relative_location = os.path.relpath(location, repo_root)
         
         # Add entry to .gitignore if it doesn't already contain it
-        if os.path.exists(gitignore_path):
-            with open(gitignore_path, 'r') as f:
-                gitignore_content = f.read()
-                
-            # Check if the location is already ignored
-            if relative_location not in gitignore_content.split('\n'):
-                with open(gitignore_path, 'a') as f:
-                    f.write(f"\n# GWTM worktrees\n{relative_location}\n")
-                    self.logger.debug(f"Added {relative_location} to .gitignore")
-        else:
-            # Create .gitignore if it doesn't exist
-            with open(gitignore_path, 'w') as f:
+        try:
+            # Create .gitignore if it doesn't exist; O_EXCL makes the
+            # create-vs-append decision without a separate exists() check
+            fd = os.open(gitignore_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            with os.fdopen(fd, 'w') as f:
                 f.write(f"# GWTM worktrees\n{relative_location}\n")
-                self.logger.debug(f"Created .gitignore with {relative_location}")
-                
+            self.logger.debug(f"Created .gitignore with {relative_location}")
+        except FileExistsError:
+            # Stream the existing lines instead of materializing the whole
+            # file; append only when no line matches exactly
+            with open(gitignore_path, 'r+') as f:
+                for line in f:
+                    if line.rstrip('\n') == relative_location:
+                        return location
+                f.write(f"\n# GWTM worktrees\n{relative_location}\n")
+            self.logger.debug(f"Added {relative_location} to .gitignore")
+
         return location
     
     def add_worktree(self, path: Optional[str] = None, branch: Optional[str] = None, new_branch: bool = False) -> None:
@@ -162,7 +336,7 @@ class GitWorktreeManager:
             self.logger.debug("No branch specified, using current HEAD")
         
         self.logger.debug(f"Running git command: git {' '.join(args)}")
-        result = self._run_git(args, capture_output=False)
+        result = self._git_passthrough(args)
         
         if result.returncode == 0:
             print(f"Worktree created at {path}")
@@ -176,7 +350,7 @@ class GitWorktreeManager:
             print("Error: Not in a git repository")
             sys.exit(1)
             
-        result = self._run_git(["worktree", "list"])
+        result = self._git_capture(["worktree", "list"])
         if result.returncode == 0:
             # Format and print the output
             worktrees = result.stdout.strip().split('\n')
@@ -199,16 +373,17 @@ class GitWorktreeManager:
             print("Error: Not in a git repository")
             sys.exit(1)
             
-        result = self._run_git(["worktree", "remove", path])
+        result = self._git_passthrough(["worktree", "remove", path])
         if result.returncode == 0:
             print(f"Worktree at {path} removed")
             
             if prune:
-                prune_result = self._run_git(["worktree", "prune"])
+                prune_result = self._git_passthrough(["worktree", "prune"])
                 if prune_result.returncode == 0:
                     print("Pruned stale worktree data")
         else:
-            print(f"Error removing worktree: {result.stderr}")
+            # git already printed its diagnostics to the inherited stderr
+            print(f"Error removing worktree at {path}")
     
     def merge_from_worktree(self, path: str, target_branch: Optional[str] = None) -> None:
         """Merge changes from a worktree branch into the target branch (default: current branch)"""
@@ -224,20 +399,8 @@ class GitWorktreeManager:
             
         # Get the branch of the worktree
         self.logger.debug(f"Getting branch for worktree at {abs_path}")
-        worktree_list = self._run_git(["worktree", "list", "--porcelain"])
-        
-        worktree_branch = None
-        current_worktree = None
-        for line in worktree_list.stdout.split('\n'):
-            if line.startswith('worktree '):
-                current_worktree = line.replace('worktree ', '').strip()
-            elif line.startswith('branch ') and current_worktree == abs_path:
-                worktree_branch = line.replace('branch ', '').strip()
-                # Convert from refs/heads/branch-name to just branch-name
-                if worktree_branch.startswith('refs/heads/'):
-                    worktree_branch = worktree_branch[len('refs/heads/'):]
-                break
-        
+        worktree_branch = self._git_bulk_status().get(abs_path)
+
         if not worktree_branch:
             print(f"Error: Could not determine branch for worktree at {abs_path}")
             sys.exit(1)
@@ -245,7 +408,7 @@ class GitWorktreeManager:
         self.logger.debug(f"Worktree branch: {worktree_branch}")
         
         # Check for uncommitted changes in the worktree
-        status_result = self._run_git(["--git-dir", os.path.join(abs_path, ".git"), 
+        status_result = self._git_capture(["--git-dir", os.path.join(abs_path, ".git"), 
                                        "--work-tree", abs_path, "status", "--porcelain"])
         
         if status_result.stdout.strip():
@@ -254,15 +417,16 @@ class GitWorktreeManager:
             print("Please commit or stash your changes in the worktree first.")
             sys.exit(1)
             
-        # Check if the branch has any commits
-        branch_check = self._run_git(["branch", "-a"])
-        if worktree_branch not in branch_check.stdout:
+        # Check if the branch has any commits (exact ref lookup, rc only)
+        branch_check = self._git_capture(["show-ref", "--verify", "--quiet",
+                                      f"refs/heads/{worktree_branch}"])
+        if branch_check.returncode != 0:
             print(f"Error: Branch '{worktree_branch}' not found. Have you made any commits in the worktree?")
             sys.exit(1)
             
         # Determine target branch (use current branch if not specified)
         if not target_branch:
-            target_branch_result = self._run_git(["branch", "--show-current"])
+            target_branch_result = self._git_capture(["branch", "--show-current"])
             target_branch = target_branch_result.stdout.strip()
             if not target_branch:
                 print("Error: Could not determine current branch and no target branch specified")
@@ -280,20 +444,20 @@ class GitWorktreeManager:
         
         # Make sure we have the latest changes from remote if available
         try:
-            self._run_git(["fetch", "origin", target_branch])
+            self._git_passthrough(["fetch", "origin", target_branch])
             print(f"Fetched latest changes for target branch '{target_branch}' from remote")
         except:
             print(f"Note: Could not fetch from remote for branch '{target_branch}' - continuing with local merge")
             
         # Checkout the target branch
-        checkout_result = self._run_git(["checkout", target_branch], capture_output=False)
+        checkout_result = self._git_passthrough(["checkout", target_branch])
         if checkout_result.returncode != 0:
             print(f"Error: Failed to checkout target branch '{target_branch}'")
             sys.exit(1)
             
         # Merge the local worktree branch (not from remote)
         print(f"Merging local branch '{worktree_branch}'...")
-        merge_result = self._run_git(["merge", worktree_branch], capture_output=True)
+        merge_result = self._git_capture(["merge", worktree_branch])
         
         if merge_result.returncode != 0:
             print(f"Merge conflicts detected. Please resolve conflicts and complete the merge manually.")
@@ -306,7 +470,7 @@ class GitWorktreeManager:
             else:
                 print(f"Successfully merged '{worktree_branch}' into '{target_branch}'")
                 print(f"Merge summary:")
-                summary = self._run_git(["log", "-1", "--stat"])
+                summary = self._git_capture(["log", "-1", "--stat"])
                 print(summary.stdout)
     
     def switch_worktree(self, path: str) -> None:
@@ -320,7 +484,7 @@ class GitWorktreeManager:
         print(f"To switch to the worktree at {abs_path}, run:")
         print(f"cd {abs_path}")
     
-    def open_ide(self, path: str, ide: Optional[str] = None) -> None:
+    def open_ide(self, path: str, ide: Optional[str] = None, use_cache: bool = True) -> None:
         """Open a worktree in an IDE"""
         abs_path = os.path.abspath(path)
         if not os.path.exists(abs_path):
@@ -338,8 +502,9 @@ class GitWorktreeManager:
             sys.exit(1)
             
         self.logger.debug(f"Opening {abs_path} in {ide}")
-        
+
         # Use the IDE handler to open the IDE
+        self.ide_handler.use_cache = use_cache
         success = self.ide_handler.open_in_ide(abs_path, ide)
         
         if success:
@@ -350,7 +515,7 @@ class GitWorktreeManager:
             sys.exit(1)
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Git WorkTree Manager")
     subparsers = parser.add_subparsers(dest="command", help="Command to run")
     
@@ -376,8 +541,10 @@ def main():
     # Open IDE command
     open_parser = subparsers.add_parser("open", help="Open a worktree in an IDE")
     open_parser.add_argument("path", help="Path of the worktree to open")
-    open_parser.add_argument("ide", nargs="?", choices=["xcode", "androidstudio"], 
+    open_parser.add_argument("ide", nargs="?", choices=["xcode", "androidstudio"],
                             help="IDE to use (default from config if not specified)")
+    open_parser.add_argument("--no-ide-cache", action="store_true",
+                            help="Rescan the worktree instead of using the cached project location")
     
     # Merge command
     merge_parser = subparsers.add_parser("merge", help="Merge changes from a worktree branch")
@@ -389,12 +556,12 @@ def main():
     parser.add_argument("--config", help="Path to config file")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
     
-    args = parser.parse_args()
-    
-    # Initialize the manager
-    manager = GitWorktreeManager(args.config, args.debug)
-    
-    # Execute the appropriate command
+    return parser
+
+
+def dispatch(parser: argparse.ArgumentParser, args: argparse.Namespace,
+             manager: GitWorktreeManager) -> None:
+    """Execute the parsed command on the given manager"""
     if args.command == "add":
         manager.add_worktree(args.path, args.branch, args.new_branch)
     elif args.command == "list":
@@ -404,12 +571,175 @@ def main():
     elif args.command == "switch":
         manager.switch_worktree(args.path)
     elif args.command == "open":
-        manager.open_ide(args.path, args.ide)
+        manager.open_ide(args.path, args.ide, not args.no_ide_cache)
     elif args.command == "merge":
         manager.merge_from_worktree(args.path, args.target_branch)
     else:
         parser.print_help()
 
 
+def _default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.path.expanduser("~/.cache/gwtm")
+    return os.path.join(runtime_dir, "gwtm.sock")
+
+
+def _try_daemon(argv: List[str]) -> Optional[int]:
+    """Forward argv to a running gwtm daemon, if one is reachable.
+
+    Returns the daemon's exit code, or None to fall back to in-process
+    execution. Skipping interpreter/config startup is the whole point, so
+    this runs before any argparse work.
+    """
+    sock_path = os.environ.get("GWTM_SOCK")
+    if not sock_path or not os.path.exists(sock_path):
+        return None
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        with client, client.makefile("rw") as stream:
+            client.connect(sock_path)
+            stream.write(json.dumps({"argv": argv, "cwd": os.getcwd()}) + "\n")
+            stream.flush()
+            reply = json.loads(stream.readline())
+    except (OSError, ValueError):
+        return None
+    sys.stdout.write(reply.get("output", ""))
+    return int(reply.get("rc", 0))
+
+
+def daemon_main():
+    """Serve gwtm commands from a warm interpreter over a Unix socket.
+
+    Scripted flows that invoke gwtm many times in a row pay interpreter and
+    config startup on every call; the daemon pays it once and turns each
+    subsequent command into socket I/O.
+    """
+    sock_path = os.environ.get("GWTM_SOCK") or _default_socket_path()
+    os.makedirs(os.path.dirname(sock_path), exist_ok=True)
+    with contextlib.suppress(OSError):
+        os.unlink(sock_path)
+
+    parser = build_parser()
+    managers: Dict[Any, GitWorktreeManager] = {}
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with server:
+        server.bind(sock_path)
+        server.listen()
+        print(f"gwtm daemon listening on {sock_path}")
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rw") as stream:
+                line = stream.readline()
+                if not line:
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    continue
+                # Capture at the fd level, not just sys.stdout/sys.stderr:
+                # passthrough git children inherit the real fds 1/2, so
+                # those are pointed at a spool file for the duration and
+                # Python-level prints are routed to the same file through an
+                # unbuffered wrapper to keep the interleaving faithful
+                rc = 0
+                with tempfile.TemporaryFile() as spool:
+                    saved_out = os.dup(1)
+                    saved_err = os.dup(2)
+                    os.dup2(spool.fileno(), 1)
+                    os.dup2(spool.fileno(), 2)
+                    text = io.TextIOWrapper(os.fdopen(os.dup(spool.fileno()), "wb", 0),
+                                            write_through=True)
+                    try:
+                        with contextlib.redirect_stdout(text), contextlib.redirect_stderr(text):
+                            os.chdir(request.get("cwd", os.getcwd()))
+                            args = parser.parse_args(request.get("argv", []))
+                            if args.command:
+                                key = (args.config, args.debug)
+                                if key not in managers:
+                                    managers[key] = GitWorktreeManager(args.config, args.debug)
+                                # The cwd (and with it the git context) can differ
+                                # per request, so drop the cached context
+                                managers[key]._git_ctx = None
+                                dispatch(parser, args, managers[key])
+                            else:
+                                parser.print_help()
+                    except SystemExit as e:
+                        if isinstance(e.code, int):
+                            rc = e.code
+                        elif e.code is not None:
+                            rc = 1
+                    except Exception as e:
+                        text.write(f"Error: {e}\n")
+                        rc = 1
+                    finally:
+                        text.close()
+                        os.dup2(saved_out, 1)
+                        os.dup2(saved_err, 2)
+                        os.close(saved_out)
+                        os.close(saved_err)
+                    spool.seek(0)
+                    output = spool.read().decode("utf-8", "replace")
+                stream.write(json.dumps({"rc": rc, "output": output}) + "\n")
+                stream.flush()
+
+
+def repl_main():
+    """Run newline-delimited gwtm command lines from stdin in-process.
+
+    Lets a driving process (scripts, the test suite) issue many commands
+    against one warm interpreter instead of paying Python startup per
+    invocation. Each command ends with a `---END--- <rc>` sentinel line.
+    """
+    parser = build_parser()
+    managers: Dict[Any, GitWorktreeManager] = {}
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        rc = 0
+        try:
+            args = parser.parse_args(shlex.split(line))
+            if args.command:
+                key = (args.config, args.debug)
+                if key not in managers:
+                    managers[key] = GitWorktreeManager(args.config, args.debug)
+                managers[key]._git_ctx = None
+                dispatch(parser, args, managers[key])
+            else:
+                parser.print_help()
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                rc = e.code
+            elif e.code is not None:
+                rc = 1
+        except Exception as e:
+            print(f"Error: {e}")
+            rc = 1
+        print(f"---END--- {rc}", flush=True)
+
+
+def main():
+    if sys.argv[1:] in (["--repl"], ["--stdin"]):
+        repl_main()
+        return
+
+    # Hot path: hand the command to a running daemon before doing any
+    # argparse or config work
+    daemon_rc = _try_daemon(sys.argv[1:])
+    if daemon_rc is not None:
+        sys.exit(daemon_rc)
+
+    parser = build_parser()
+    args = parser.parse_args()
+
+    # Only construct the manager once we know a command will run, so help
+    # and unknown commands skip config loading entirely
+    if not args.command:
+        parser.print_help()
+        return
+
+    dispatch(parser, args, GitWorktreeManager(args.config, args.debug))
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,16 +10,52 @@ Usage:
   python tests.py full      # Run comprehensive tests
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
+import functools
 import os
+import shlex
 import sys
 import shutil
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 
+# Computed once: the gwtm entry point and the interpreter running this suite
+# (sys.executable skips a PATH lookup on every spawn)
+_GWTM_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "src", "main.py"))
+_PY = sys.executable
+
+# Per-command chatter is gated: it costs stdout-lock acquisitions and write
+# syscalls on every call, and bloats CI logs. Failures always print.
+VERBOSE = os.environ.get("GWTM_TEST_VERBOSE", "0") == "1"
+
+# Pre-encoded bytes: written with one os.write, no TextIOWrapper or
+# encode pass involved
+CONFIG_TEXT = b"""
+[defaults]
+ide = vscode
+
+[paths]
+xcode = /Applications/Xcode-test.app
+androidstudio = /Applications/Android Studio-test.app
+vscode = /Applications/VSCode-test.app
+"""
+
+# The test config is written once per process and removed at exit, so
+# re-running or parametrizing the config test never re-hits the filesystem
+_CFG_PATH = tempfile.NamedTemporaryFile(delete=False, suffix="_gwtmrc").name
+_cfg_fd = os.open(_CFG_PATH, os.O_WRONLY | os.O_TRUNC)
+os.write(_cfg_fd, CONFIG_TEXT)
+os.close(_cfg_fd)
+atexit.register(os.remove, _CFG_PATH)
+
 # Import the GWTM classes for direct testing
 try:
     from main import GitWorktreeManager
@@ -28,69 +64,204 @@ except ImportError:
     print("Error: Could not import GWTM modules. Make sure you're running this from the project root.")
     sys.exit(1)
 
-def run_command(cmd, cwd=None):
-    """Run a command and print its output."""
-    print(f"Running: {cmd}")
-    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=cwd)
-    print(f"Exit code: {result.returncode}")
-    if result.stdout:
-        print("Output:")
-        print(result.stdout)
-    if result.stderr and result.returncode != 0:
-        print("Error:")
-        print(result.stderr)
-    print("-" * 50)
+def run_command(cmd, cwd=None, capture=True):
+    """Run a command and print its output.
+
+    Accepts an argv list (executed directly) or a string (shlex-split), so
+    no intermediate shell process is forked. Pass capture=False for
+    fire-and-forget calls whose output nobody inspects; that skips the
+    pipe setup and buffering entirely.
+    """
+    argv = cmd if isinstance(cmd, list) else shlex.split(cmd)
+    if not capture:
+        result = subprocess.run(argv, cwd=cwd,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if VERBOSE:
+            sys.stdout.write(f"Running: {cmd}\nExit code: {result.returncode}\n{'-' * 50}\n")
+        elif result.returncode != 0:
+            sys.stdout.write(f"Command failed ({result.returncode}): {cmd}\n")
+        return result
+    # Capture raw bytes; decoding is deferred until something is printed
+    result = subprocess.run(argv, capture_output=True, cwd=cwd)
+    if VERBOSE or result.returncode != 0:
+        # One batched write per command keeps lock traffic down
+        parts = [f"Running: {cmd}", f"Exit code: {result.returncode}"]
+        if result.stdout:
+            parts += ["Output:", result.stdout.decode("utf-8", "replace")]
+        if result.stderr and result.returncode != 0:
+            parts += ["Error:", result.stderr.decode("utf-8", "replace")]
+        parts.append("-" * 50)
+        sys.stdout.write("\n".join(parts) + "\n")
     return result
 
-def create_test_repo():
-    """Create a test Git repository."""
-    # Create a temporary directory
-    temp_dir = tempfile.mkdtemp(prefix="gwtm_test_")
-    print(f"Created test directory: {temp_dir}")
-    
-    # Initialize a Git repository
-    run_command("git init", cwd=temp_dir)
-    
-    # Create a test file
+async def _init_test_repo(temp_dir):
+    """Set up the fixture repo, overlapping independent work.
+
+    `git init` and writing the test file don't depend on each other, so the
+    process spawn and the disk write run concurrently; the order-dependent
+    remainder stays in the single consolidated shell invocation.
+    """
     test_file = os.path.join(temp_dir, "test-file.txt")
-    with open(test_file, "w") as f:
-        f.write("This is a test file for GWTM.")
-    
-    # Make an initial commit
-    run_command("git add test-file.txt", cwd=temp_dir)
-    run_command("git config user.name 'GWTM Tester'", cwd=temp_dir)
-    run_command("git config user.email 'test@example.com'", cwd=temp_dir)
-    run_command("git commit -m 'Initial commit'", cwd=temp_dir)
-    
-    # Create a test branch
-    run_command("git checkout -b test-branch", cwd=temp_dir)
-    
-    # Go back to main branch
-    run_command("git checkout master || git checkout main", cwd=temp_dir)
-    
+
+    async def _git_init():
+        # Pinning the branch name keeps the fixture deterministic without a
+        # master-or-main checkout fallback
+        proc = await asyncio.create_subprocess_exec(
+            "git", "-c", "init.defaultBranch=main", "init", cwd=temp_dir,
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+        await proc.wait()
+
+    def _write_test_file():
+        # One open + one write syscall, skipping the TextIOWrapper setup
+        fd = os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        os.write(fd, b"This is a test file for GWTM.")
+        os.close(fd)
+
+    await asyncio.gather(_git_init(), asyncio.to_thread(_write_test_file))
+
+    # Commit the file and create the test branch in one shell invocation
+    setup_script = " && ".join([
+        "git config user.name 'GWTM Tester'",
+        "git config user.email 'test@example.com'",
+        "git add test-file.txt",
+        "git commit -m 'Initial commit'",
+        # update-ref creates the branch without materializing it in the
+        # working tree, so no checkout-back is needed
+        "git update-ref refs/heads/test-branch HEAD",
+    ])
+    # The &&-chain needs a shell; spawn it explicitly for this one call
+    run_command(["sh", "-c", setup_script], cwd=temp_dir, capture=False)
+
+def init_git_repo(temp_dir):
+    """Initialize the fixture repository inside an existing directory."""
+    asyncio.run(_init_test_repo(temp_dir))
     return temp_dir
 
+@contextlib.contextmanager
+def test_repo():
+    """Yield a fresh fixture repository, tearing it down on exit.
+
+    Unlike tempfile.TemporaryDirectory, teardown goes through
+    cleanup_test_repo so the unlinks run on the thread pool.
+    """
+    repo_dir = tempfile.mkdtemp(prefix="gwtm_test_")
+    if VERBOSE:
+        print(f"Created test directory: {repo_dir}")
+    _warm_repl(repo_dir)
+    init_git_repo(repo_dir)
+    try:
+        yield repo_dir
+    finally:
+        cleanup_test_repo(repo_dir)
+
+def _parallel_rmtree(root):
+    """Delete a tree with the file unlinks fanned out to a thread pool.
+
+    Git repos hold thousands of small loose-object files; removing them one
+    serial unlink at a time is syscall-latency bound.
+    """
+    files = []
+    dirs = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(os.unlink, files))
+    # Children were discovered after their parents, so reversed order
+    # removes the now-empty directories bottom-up
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
 def cleanup_test_repo(repo_dir):
-    """Clean up the test repository."""
-    print(f"Cleaning up test repository: {repo_dir}")
+    """Clean up the test repository, ignoring a missing or contested tree."""
     try:
-        shutil.rmtree(repo_dir)
-        print(f"Removed test directory: {repo_dir}")
-    except Exception as e:
-        print(f"Error removing test directory: {e}")
+        _parallel_rmtree(repo_dir)
+    except OSError:
+        # Whatever the fast path tripped over, rmtree with ignore_errors
+        # finishes the job without a pre-flight stat or error chatter
+        shutil.rmtree(repo_dir, ignore_errors=True)
+
+# One persistent `main.py --repl` helper per test repo, so each gwtm command
+# costs a pipe round-trip instead of a full Python interpreter startup
+_REPL_PROCS = {}
+_REPL_LOCK = threading.Lock()
+
+def _get_repl_proc(repo_dir):
+    """Get (or start) the persistent gwtm REPL process for repo_dir."""
+    with _REPL_LOCK:
+        proc = _REPL_PROCS.get(repo_dir)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen([_PY, "-u", _GWTM_PATH, "--repl"],
+                                    stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, cwd=repo_dir, text=True)
+            _REPL_PROCS[repo_dir] = proc
+        return proc
+
+def _warm_repl(repo_dir):
+    """Kick off the REPL helper in the background.
+
+    The child interpreter's startup and module imports then overlap with
+    whatever setup the calling test does next.
+    """
+    threading.Thread(target=_get_repl_proc, args=(repo_dir,), daemon=True).start()
+
+def _shutdown_repl_procs():
+    for proc in _REPL_PROCS.values():
+        if proc.poll() is None:
+            proc.stdin.close()
+            proc.wait()
+
+atexit.register(_shutdown_repl_procs)
 
 def run_gwtm_command(cmd, repo_dir):
-    """Run a GWTM command."""
-    gwtm_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "src", "main.py"))
-    full_cmd = f"python {gwtm_path} {cmd}"
-    return run_command(full_cmd, cwd=repo_dir)
+    """Run a GWTM command through the persistent REPL helper."""
+    proc = _get_repl_proc(repo_dir)
+    proc.stdin.write(cmd + "\n")
+    proc.stdin.flush()
+    output_lines = []
+    returncode = 1
+    for line in proc.stdout:
+        if line.startswith("---END---"):
+            returncode = int(line.split()[1])
+            break
+        output_lines.append(line)
+    stdout = "".join(output_lines)
+    if VERBOSE or returncode != 0:
+        parts = [f"Running: gwtm {cmd}", f"Exit code: {returncode}"]
+        if stdout:
+            parts += ["Output:", stdout]
+        parts.append("-" * 50)
+        sys.stdout.write("\n".join(parts) + "\n")
+    return subprocess.CompletedProcess(cmd, returncode, stdout, "")
+
+@functools.lru_cache(maxsize=4)
+def _get_manager(config_path=None):
+    """Construct (or reuse) a GitWorktreeManager for the given config path."""
+    return GitWorktreeManager(config_path)
+
+class GwtmRepl:
+    """Pipelined view of the persistent REPL helper for one repo."""
+
+    def __init__(self, repo_dir):
+        self.repo_dir = repo_dir
+
+    def send(self, cmd):
+        """Run one gwtm command line and return its exit code."""
+        return run_gwtm_command(cmd, self.repo_dir).returncode
 
 def test_direct_import():
     """Test direct import of GWTM classes."""
     print("Testing direct import of GWTM classes...")
     
     # Test GitWorktreeManager
-    manager = GitWorktreeManager()
+    manager = _get_manager(None)
     assert isinstance(manager, GitWorktreeManager), "Failed to create GitWorktreeManager instance"
     
     # Test IDEHandler
@@ -105,90 +276,82 @@ def test_direct_import():
     print("Direct import tests passed.")
     print("-" * 50)
 
-def test_cli_interface(repo_dir):
+def test_cli_interface():
     """Test the CLI interface."""
     print("Testing CLI interface...")
-    
+
+    with test_repo() as repo_dir:
+        _run_cli_interface_checks(repo_dir)
+
+    print("CLI interface tests passed.")
+    print("-" * 50)
+
+def _run_cli_interface_checks(repo_dir):
+    # All six subcommands go through one pipelined REPL process
+    repl = GwtmRepl(repo_dir)
+
     # Test help command
-    result = run_gwtm_command("--help", repo_dir)
-    assert result.returncode == 0, "Help command failed"
-    
+    assert repl.send("--help") == 0, "Help command failed"
+
     # Test list command
-    result = run_gwtm_command("list", repo_dir)
-    assert result.returncode == 0, "List command failed"
-    
+    assert repl.send("list") == 0, "List command failed"
+
     # Create a worktree directory
     worktree_path = os.path.join(repo_dir, "worktrees", "test-worktree")
-    
+
     # Test add command
-    result = run_gwtm_command(f"add {worktree_path} test-branch", repo_dir)
-    assert result.returncode == 0, "Add command failed"
+    assert repl.send(f"add {worktree_path} test-branch") == 0, "Add command failed"
     assert os.path.exists(worktree_path), f"Worktree directory not created at {worktree_path}"
-    
+
     # Test list command again
-    result = run_gwtm_command("list", repo_dir)
-    assert result.returncode == 0, "List command failed after adding worktree"
-    
+    assert repl.send("list") == 0, "List command failed after adding worktree"
+
     # Test switch command
-    result = run_gwtm_command(f"switch {worktree_path}", repo_dir)
-    assert result.returncode == 0, "Switch command failed"
-    
+    assert repl.send(f"switch {worktree_path}") == 0, "Switch command failed"
+
     # Test remove command
-    result = run_gwtm_command(f"remove {worktree_path}", repo_dir)
-    assert result.returncode == 0, "Remove command failed"
-    
+    assert repl.send(f"remove {worktree_path}") == 0, "Remove command failed"
+
     # Check if worktree was removed
     assert not os.path.exists(worktree_path), f"Worktree directory not removed at {worktree_path}"
-    
-    print("CLI interface tests passed.")
-    print("-" * 50)
 
-def test_new_branch_creation(repo_dir):
+def test_new_branch_creation():
     """Test creating a new branch with a worktree."""
     print("Testing new branch creation...")
-    
+
+    with test_repo() as repo_dir:
+        _run_new_branch_checks(repo_dir)
+
+    print("New branch creation tests passed.")
+    print("-" * 50)
+
+def _run_new_branch_checks(repo_dir):
     # Create a worktree with a new branch
     worktree_path = os.path.join(repo_dir, "worktrees", "new-branch-test")
     result = run_gwtm_command(f"add {worktree_path} new-feature-branch -b", repo_dir)
     assert result.returncode == 0, "Creating worktree with new branch failed"
     
-    # Verify the branch exists
-    branch_check = run_command("git branch", cwd=repo_dir)
-    assert "new-feature-branch" in branch_check.stdout, "New branch not created"
+    # Verify the branch exists: rev-parse --verify is a single ref lookup
+    # answered by the exit code alone, with nothing to capture or parse
+    result = subprocess.run(["git", "rev-parse", "--verify", "--quiet",
+                             "refs/heads/new-feature-branch"],
+                            cwd=repo_dir, stdout=subprocess.DEVNULL)
+    assert result.returncode == 0, "New branch not created"
     
     # Clean up the worktree
     run_gwtm_command(f"remove {worktree_path}", repo_dir)
-    
-    print("New branch creation tests passed.")
-    print("-" * 50)
 
 def test_config_handling():
     """Test config file handling."""
     print("Testing configuration handling...")
     
-    # Create a test config file
-    config_path = os.path.join(tempfile.gettempdir(), "test_gwtmrc")
-    with open(config_path, "w") as f:
-        f.write("""
-[defaults]
-ide = vscode
+    # Create manager with the test config written at module import
+    manager = _get_manager(_CFG_PATH)
 
-[paths]
-xcode = /Applications/Xcode-test.app
-androidstudio = /Applications/Android Studio-test.app
-vscode = /Applications/VSCode-test.app
-""")
-    
-    # Create manager with the test config
-    manager = GitWorktreeManager(config_path)
-    
     # Check if config was loaded
     assert manager.config.get("defaults", "ide") == "vscode", "Config not loaded correctly"
     assert manager.config.get("paths", "xcode") == "/Applications/Xcode-test.app", "IDE path not loaded correctly"
-    
-    # Clean up
-    os.remove(config_path)
-    
+
     print("Configuration handling tests passed.")
     print("-" * 50)
 
@@ -198,10 +361,10 @@ def run_basic_tests():
     print("=" * 70)
     
     # Test help command
-    run_command("python src/main.py --help")
+    run_command(f"{_PY} {_GWTM_PATH} --help")
     
     # Test list command (should fail if not in a git repo)
-    run_command("python src/main.py list")
+    run_command(f"{_PY} {_GWTM_PATH} list")
     
     # Create a test git repo if we're not in one
     if not os.path.exists(".git"):
@@ -212,7 +375,7 @@ def run_basic_tests():
         run_command("git commit -m 'Initial commit'")
     
     # Now test list command again
-    run_command("python src/main.py list")
+    run_command(f"{_PY} {_GWTM_PATH} list")
     
     print("Basic tests completed.")
     return 0
@@ -222,38 +385,28 @@ def run_comprehensive_tests():
     print("Running comprehensive tests for GWTM - Git WorkTree Manager")
     print("=" * 70)
     
-    test_repo_dir = None
-    
-    try:
-        # Test direct imports
-        test_direct_import()
-        
-        # Test config handling
-        test_config_handling()
-        
-        # Create a test repository
-        test_repo_dir = create_test_repo()
-        
-        # Test CLI interface
-        test_cli_interface(test_repo_dir)
-        
-        # Test new branch creation
-        test_new_branch_creation(test_repo_dir)
-        
-        print("=" * 70)
-        print("All comprehensive tests passed successfully!")
-        
-    except AssertionError as e:
-        print(f"Test failed: {e}")
-        return 1
-    except Exception as e:
-        print(f"Error during tests: {e}")
+    # The four tests are independent and dominated by subprocess latency,
+    # so run them concurrently; each CLI test owns (and cleans up) its repo
+    tests = (test_direct_import, test_config_handling,
+             test_cli_interface, test_new_branch_creation)
+    failures = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {executor.submit(test): test.__name__ for test in tests}
+        for future, name in futures.items():
+            try:
+                future.result()
+            except AssertionError as e:
+                failures.append(f"{name}: {e}")
+            except Exception as e:
+                failures.append(f"{name}: error during test: {e}")
+
+    if failures:
+        for failure in failures:
+            print(f"Test failed: {failure}")
         return 1
-    finally:
-        # Clean up
-        if test_repo_dir and os.path.exists(test_repo_dir):
-            cleanup_test_repo(test_repo_dir)
-    
+
+    print("=" * 70)
+    print("All comprehensive tests passed successfully!")
     return 0
 
 def main():